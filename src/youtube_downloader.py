@@ -7,6 +7,8 @@ from tkinter.ttk import Progressbar, Button, Label, Entry, Style, Frame
 from PIL import Image, ImageTk
 import yt_dlp
 import threading
+from concurrent.futures import Future
+import shutil
 import requests
 from io import BytesIO
 from plyer import notification
@@ -17,6 +19,7 @@ import webbrowser
 # Configuration for destination path and download history
 config_file = os.path.join("src", "config.json")
 history_file = os.path.join("src", "history.json")
+archive_file = os.path.join("src", "archive.json")
 translations_file = os.path.join("src", "translations.json")
 
 
@@ -44,6 +47,18 @@ def save_history(history):
         json.dump(history, file, ensure_ascii=False, indent=4)
 
 
+def load_archive():
+    if os.path.exists(archive_file):
+        with open(archive_file, "r", encoding="utf-8") as file:
+            return json.load(file)
+    return {}
+
+
+def save_archive(archive):
+    with open(archive_file, "w", encoding="utf-8") as file:
+        json.dump(archive, file, ensure_ascii=False, indent=4)
+
+
 def load_translations():
     if os.path.exists(translations_file):
         with open(translations_file, "r", encoding="utf-8") as file:
@@ -53,10 +68,26 @@ def load_translations():
 
 config = load_config()
 history = load_history()
+archive = load_archive()
+archive_lock = threading.Lock()
 translations = load_translations()
 download_thread = None
+sync_thread = None
 download_running = False
 video_info_fetched = False
+video_info = None
+last_destination = None
+reservations = []
+reserved_space_lock = threading.Lock()
+space_margin = 1.1
+# Upper bounds for converted audio in bytes per second (16-bit stereo PCM, 320k mp3)
+audio_output_rates = {"wav": 176400, "mp3": 40000}
+prefetch_jobs = {}
+prefetch_lock = threading.Lock()
+prefetch_slots = threading.BoundedSemaphore(2)
+prefetch_after_id = None
+prefetch_delay = 500  # ms
+prefetch_limit = 10
 current_language = config.get("language", "en")
 
 
@@ -162,29 +193,216 @@ def validate_url(url):
     return re.match(regex, url) is not None
 
 
+# Function to estimate the size of a single format in bytes
+def estimate_format_size(fmt, duration):
+    size = fmt.get("filesize") or fmt.get("filesize_approx")
+    if size:
+        return size
+    if fmt.get("tbr") and duration:
+        # tbr is in kbit/s
+        return fmt["tbr"] * 1000 / 8 * duration
+    return None
+
+
+# Function to estimate the disk space a download needs, intermediates included
+def estimate_required_space(info, download_type, output_format):
+    if not info:
+        return None
+    duration = info.get("duration")
+    if download_type == "video":
+        formats = info.get("requested_formats") or [info]
+    else:
+        audio_formats = [
+            f
+            for f in info.get("formats", [])
+            if f.get("vcodec") == "none" and f.get("acodec") not in (None, "none")
+        ]
+        audio_formats = [
+            f for f in audio_formats if f.get("ext") == "m4a"
+        ] or audio_formats
+        if not audio_formats:
+            return None
+        formats = [
+            max(audio_formats, key=lambda f: f.get("abr") or f.get("tbr") or 0)
+        ]
+
+    sizes = [estimate_format_size(f, duration) for f in formats]
+    if None in sizes:
+        return None
+    size = sum(sizes)
+    # Merging keeps the separate streams on disk next to the merged file
+    peak = size * 2 if len(formats) > 1 else size
+    # Converting keeps the source on disk next to the output
+    if output_format in audio_output_rates:
+        if not duration:
+            return None
+        peak = max(peak, size + audio_output_rates[output_format] * duration)
+    elif output_format != "mp4":
+        peak = max(peak, size * 2)
+    return int(peak * space_margin)
+
+
+# Function to find the closest existing directory for a path
+def nearest_existing_path(path):
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+# Function to get the free space of a destination minus queued reservations
+def get_available_space(path):
+    path = nearest_existing_path(path)
+    free = shutil.disk_usage(path).free
+    device = os.stat(path).st_dev
+    return free - sum(r["size"] for r in reservations if r["device"] == device)
+
+
+# Function to pick the destination with the most room and reserve space on it
+def reserve_destination(destinations, required):
+    with reserved_space_lock:
+        available = {}
+        for destination in dict.fromkeys(d for d in destinations if d):
+            try:
+                available[destination] = get_available_space(destination)
+            except OSError:
+                continue
+        if not available:
+            return None, None, None
+        destination = max(available, key=available.get)
+        # A job of unknown size is let through without a reservation
+        if required is not None and available[destination] < required:
+            return None, available[destination], None
+        reservation = {
+            "device": os.stat(nearest_existing_path(destination)).st_dev,
+            "required": required or 0,
+            "size": required or 0,
+            "written": {},
+        }
+        reservations.append(reservation)
+    return destination, available[destination], reservation
+
+
+# Function to shrink a reservation by the bytes a job has already written
+def update_reservation(reservation, d):
+    if d["status"] not in ("downloading", "finished"):
+        return
+    written = d.get("downloaded_bytes") or d.get("total_bytes") or 0
+    with reserved_space_lock:
+        reservation["written"][d.get("filename")] = written
+        reservation["size"] = max(
+            reservation["required"] - sum(reservation["written"].values()), 0
+        )
+
+
+# Function to release space reserved for a finished or failed job
+def release_space(reservation):
+    with reserved_space_lock:
+        if reservation in reservations:
+            reservations.remove(reservation)
+
+
+# Function to extract video information and its thumbnail
+def extract_video_info(url):
+    ydl_opts = {
+        "quiet": True,
+        "no_warnings": True,
+        # A watch link with &list= should not pull in the whole playlist
+        "noplaylist": True,
+        "socket_timeout": 10,
+        "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]",
+    }
+
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info_dict = ydl.extract_info(url, download=False)
+
+    img = None
+    thumbnail_url = info_dict.get("thumbnail")
+    if thumbnail_url:
+        response = requests.get(thumbnail_url, timeout=10)
+        img_data = response.content
+        img = Image.open(BytesIO(img_data))
+        # Use LANCZOS for compatibility with newer Pillow versions
+        try:
+            # For Pillow >= 10.0.0
+            img = img.resize((160, 90), Image.Resampling.LANCZOS)
+        except AttributeError:
+            try:
+                # For older Pillow versions that still have ANTIALIAS
+                img = img.resize((160, 90), Image.ANTIALIAS)
+            except AttributeError:
+                # For Pillow versions that have LANCZOS but not ANTIALIAS
+                img = img.resize((160, 90), Image.LANCZOS)
+    return info_dict, img
+
+
+# Function to get the extraction job for a URL, starting one if needed
+def get_prefetch(url):
+    with prefetch_lock:
+        job = prefetch_jobs.pop(url, None)
+        # A failed or cancelled job is retried rather than replayed
+        if job is None or job.cancelled() or (
+            job.done() and job.exception() is not None
+        ):
+            job = Future()
+            # Daemon threads so closing the window never waits on a prefetch
+            threading.Thread(target=run_prefetch, args=(job, url), daemon=True).start()
+        prefetch_jobs[url] = job
+        # Keep only the most recent URLs around
+        while len(prefetch_jobs) > prefetch_limit:
+            prefetch_jobs.pop(next(iter(prefetch_jobs))).cancel()
+        return job
+
+
+# Function to run a prefetch job, at most two extractions at a time
+def run_prefetch(job, url):
+    with prefetch_slots:
+        if not job.set_running_or_notify_cancel():
+            return
+        try:
+            job.set_result(extract_video_info(url))
+        except Exception as e:
+            job.set_exception(e)
+
+
+# Function to speculatively fetch the information of the URL in the entry
+def start_prefetch():
+    global prefetch_after_id
+    prefetch_after_id = None
+    url = url_var.get().strip()
+    # Only single videos: a channel or playlist would crawl every entry
+    if validate_url(url) and re.search(r"(watch\?v=|youtu\.be/|/shorts/)", url):
+        get_prefetch(url)
+
+
+# Function to debounce prefetching while the URL is being typed
+def on_url_change(*args):
+    global prefetch_after_id, video_info_fetched
+    video_info_fetched = False
+    if prefetch_after_id is not None:
+        root.after_cancel(prefetch_after_id)
+    prefetch_after_id = root.after(prefetch_delay, start_prefetch)
+
+
 # Function to fetch video information
 def fetch_video_info():
-    global video_info_fetched
-    url = url_var.get()
+    global video_info_fetched, video_info
+    url = url_var.get().strip()
     if not url or not validate_url(url):
         messagebox.showerror(translate("error"), translate("invalid_url"))
         return
 
+    job = get_prefetch(url)
     try:
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]",
-        }
-
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info_dict = ydl.extract_info(url, download=False)
-            title = info_dict.get("title", translate("error"))
-            thumbnail_url = info_dict.get("thumbnail")
-            duration = info_dict.get("duration")
-            formats = info_dict.get("formats", [])
-            valid_formats = [f for f in formats if f.get("filesize") is not None]
-            best_format = max(valid_formats, key=lambda x: x["filesize"])
+        info_dict, img = job.result()
+        title = info_dict.get("title", translate("error"))
+        duration = info_dict.get("duration")
+        formats = info_dict.get("formats", [])
+        valid_formats = [f for f in formats if f.get("filesize") is not None]
+        best_format = max(valid_formats, key=lambda x: x["filesize"])
 
         minutes, seconds = divmod(duration, 60)
         duration_str = f"{minutes} minutes and {int(seconds)} seconds"
@@ -199,39 +417,42 @@ def fetch_video_info():
             f"{translate('title')}: {title}\n{translate('duration')}: {duration_str}\n{translate('quality')}: {best_format['format_note']}\n{translate('size')}: {size_str}"
         )
 
-        if thumbnail_url:
-            response = requests.get(thumbnail_url)
-            img_data = response.content
-            img = Image.open(BytesIO(img_data))
-            # Use LANCZOS for compatibility with newer Pillow versions
-            try:
-                # For Pillow >= 10.0.0
-                img = img.resize((160, 90), Image.Resampling.LANCZOS)
-            except AttributeError:
-                try:
-                    # For older Pillow versions that still have ANTIALIAS
-                    img = img.resize((160, 90), Image.ANTIALIAS)
-                except AttributeError:
-                    # For Pillow versions that have LANCZOS but not ANTIALIAS
-                    img = img.resize((160, 90), Image.LANCZOS)
+        if img is not None:
             img = ImageTk.PhotoImage(img)
             thumbnail_label.config(image=img)
             thumbnail_label.image = img
 
+        video_info = info_dict
         video_info_fetched = True
     except Exception as e:
+        # Drop the failed job so the next attempt extracts again
+        with prefetch_lock:
+            if prefetch_jobs.get(url) is job:
+                del prefetch_jobs[url]
         messagebox.showerror(translate("error"), f"{translate('fetch_error')} {e}")
+        video_info = None
         video_info_fetched = False
 
 
 # Function to add download to history
-def add_to_history(filename):
-    url = url_var.get()
-    destination = destination_var.get()
-    info = info_var.get().split("\n")
-    title = info[0].replace(f'{translate("title")}: ', "")
-    duration = info[1].replace(f'{translate("duration")}: ', "")
-    size = info[3].replace(f'{translate("size")}: ', "")
+def add_to_history(filename, destination=None, video=None):
+    destination = destination or destination_var.get()
+    if video:
+        url = video.get("webpage_url", "")
+        title = video.get("title", "")
+        minutes, seconds = divmod(video.get("duration") or 0, 60)
+        duration = f"{minutes} minutes and {int(seconds)} seconds"
+        size = (
+            f"{os.path.getsize(filename) / (1024 * 1024):.2f} MB"
+            if os.path.exists(filename)
+            else "Unknown"
+        )
+    else:
+        url = url_var.get()
+        info = info_var.get().split("\n")
+        title = info[0].replace(f'{translate("title")}: ', "")
+        duration = info[1].replace(f'{translate("duration")}: ', "")
+        size = info[3].replace(f'{translate("size")}: ', "")
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     history.append(
@@ -252,7 +473,7 @@ def add_to_history(filename):
 
 # Function to download video/audio
 def download():
-    global download_running, download_thread, video_info_fetched
+    global download_running, download_thread, video_info_fetched, last_destination
     if not video_info_fetched:
         fetch_video_info()
         if not video_info_fetched:
@@ -275,6 +496,25 @@ def download():
         messagebox.showerror(translate("error"), translate("choose_destination"))
         return
 
+    # Preflight: make sure the disk can hold the download and its intermediates
+    required_space = estimate_required_space(video_info, download_type, output_format)
+    destination, available_space, reservation = reserve_destination(
+        [destination] + config.get("extra_destinations", []), required_space
+    )
+    if available_space is None:
+        messagebox.showerror(translate("error"), translate("choose_destination"))
+        return
+    if destination is None:
+        messagebox.showerror(
+            translate("error"),
+            translate("insufficient_space").format(
+                f"{(required_space or 0) / (1024 * 1024):.2f} MB",
+                f"{max(available_space, 0) / (1024 * 1024):.2f} MB",
+            ),
+        )
+        return
+    last_destination = destination
+
     mp4_file_exists = False
     mp4_filename = os.path.join(destination, "%(title)s.mp4")
 
@@ -284,13 +524,23 @@ def download():
         ydl_opts = {
             "outtmpl": os.path.join(destination, "%(title)s.%(ext)s"),
             "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]",
-            "progress_hooks": [lambda d: update_stats(d, "video")],
+            # Download only the video Fetch showed and the preflight sized
+            "noplaylist": True,
+            "progress_hooks": [
+                lambda d: update_stats(d, "video"),
+                lambda d: update_reservation(reservation, d),
+            ],
         }
     else:
         ydl_opts = {
             "outtmpl": os.path.join(destination, "%(title)s.%(ext)s"),
             "format": "bestaudio[ext=m4a]/bestaudio",
-            "progress_hooks": [lambda d: update_stats(d, "audio")],
+            # Download only the video Fetch showed and the preflight sized
+            "noplaylist": True,
+            "progress_hooks": [
+                lambda d: update_stats(d, "audio"),
+                lambda d: update_reservation(reservation, d),
+            ],
         }
 
     def run_ydl():
@@ -302,7 +552,7 @@ def download():
                 downloaded_file = ydl.prepare_filename(info)
                 if output_format != "mp4" and download_type == "video":
                     converted_file = convert_format(downloaded_file, output_format)
-                    add_to_history(converted_file)
+                    add_to_history(converted_file, destination)
                     if not mp4_file_exists:
                         os.remove(
                             downloaded_file
@@ -310,9 +560,9 @@ def download():
                 elif download_type == "audio":
                     converted_file = convert_format(downloaded_file, output_format)
                     os.remove(downloaded_file)  # Remove .m4a after conversion
-                    add_to_history(converted_file)
+                    add_to_history(converted_file, destination)
                 else:
-                    add_to_history(downloaded_file)
+                    add_to_history(downloaded_file, destination)
             update_progress(100)
             stats_var.set(translate("download_complete"))
             send_notification(
@@ -324,6 +574,7 @@ def download():
             stats_var.set(translate("error"))
             send_notification(translate("error"), translate("download_failed"))
         finally:
+            release_space(reservation)
             download_running = False
             toggle_button_state()
 
@@ -333,6 +584,199 @@ def download():
     toggle_button_state()
 
 
+# Function to get the sync source for a channel or playlist URL
+def get_sync_source(url):
+    match = re.match(
+        r"^(https?://)?(www\.)?youtube\.com/(@[^/?#]+|(channel|c|user)/[^/?#]+)"
+        r"(/(videos|streams|shorts))?/?$",
+        url,
+    )
+    if match:
+        # Channel tabs list uploads newest-first, the root lists the tabs
+        return f"https://www.youtube.com/{match.group(3)}/{match.group(6) or 'videos'}"
+    if re.match(r"^(https?://)?(www\.)?youtube\.com/playlist\?list=[\w-]+", url):
+        return url
+    return None
+
+
+# Function to check if a sync source is a playlist rather than a channel tab
+def is_playlist_source(source):
+    return "/playlist?list=" in source
+
+
+# Function to list the videos of a source that are not in the archive
+def fetch_new_entries(source):
+    archived = set(archive.get(source, []))
+    ydl_opts = {"quiet": True, "no_warnings": True}
+    new_entries = []
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        # Without processing, entries stay a lazy generator over the pages
+        info = ydl.extract_info(source, download=False, process=False)
+        while info.get("_type") in ("url", "url_transparent"):
+            info = ydl.extract_info(
+                info["url"], download=False, process=False, ie_key=info.get("ie_key")
+            )
+        for entry in info.get("entries") or []:
+            if not entry or entry.get("ie_key") == "YoutubeTab":
+                continue
+            if entry.get("id") in archived:
+                # Playlists usually add new items at the end, so keep walking
+                if is_playlist_source(source):
+                    continue
+                # Channel tabs come newest-first, so the first archived one ends it
+                break
+            new_entries.append(entry)
+    if not is_playlist_source(source):
+        # Download oldest-first so an interrupted sync never leaves gaps
+        new_entries.reverse()
+    return new_entries
+
+
+# Function to download a single new video of a synced source
+def download_sync_entry(source, entry, download_type, output_format, destinations):
+    global last_destination
+    ydl_opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "format": (
+            "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]"
+            if download_type == "video"
+            else "bestaudio[ext=m4a]/bestaudio"
+        ),
+        "progress_hooks": [
+            lambda d: update_stats(d, "sync") if d["status"] == "downloading" else None
+        ],
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(entry.get("url") or entry["id"], download=False)
+
+    required_space = estimate_required_space(info, download_type, output_format)
+    destination, available_space, reservation = reserve_destination(
+        destinations, required_space
+    )
+    if available_space is None:
+        raise OSError(translate("choose_destination"))
+    if destination is None:
+        raise OSError(
+            translate("insufficient_space").format(
+                f"{(required_space or 0) / (1024 * 1024):.2f} MB",
+                f"{max(available_space or 0, 0) / (1024 * 1024):.2f} MB",
+            )
+        )
+
+    last_destination = destination
+    try:
+        ydl_opts["outtmpl"] = os.path.join(destination, "%(title)s.%(ext)s")
+        ydl_opts["progress_hooks"].append(lambda d: update_reservation(reservation, d))
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.process_ie_result(info, download=True)
+            downloaded_file = ydl.prepare_filename(info)
+        final_file = downloaded_file
+        if download_type == "audio" or output_format != "mp4":
+            final_file = convert_format(downloaded_file, output_format)
+            if final_file != downloaded_file:
+                os.remove(downloaded_file)
+    finally:
+        release_space(reservation)
+
+    add_to_history(final_file, destination, info)
+    with archive_lock:
+        archive.setdefault(source, []).append(info["id"])
+        save_archive(archive)
+
+
+# Function to sync the configured channels/playlists, fetching only new videos
+def sync():
+    global download_running, sync_thread
+    if download_running or (sync_thread is not None and sync_thread.is_alive()):
+        return
+
+    url = url_var.get().strip()
+    destination = destination_var.get()
+    output_format = format_var.get()
+    download_type = video_audio_var.get()
+
+    if not destination:
+        messagebox.showerror(translate("error"), translate("choose_destination"))
+        return
+
+    sources = config.setdefault("sync_sources", [])
+    # Only channels and playlists are kept, a leftover video link is ignored
+    source = get_sync_source(url) if url else None
+    if source and source not in sources:
+        sources.append(source)
+        save_config(config)
+        update_sync_menu()
+    if not sources:
+        messagebox.showerror(translate("error"), translate("sync_no_sources"))
+        return
+
+    destinations = [destination] + config.get("extra_destinations", [])
+
+    def run_sync():
+        global download_running
+        downloaded = 0
+        failures = []
+        try:
+            for source in list(sources):
+                if not download_running:
+                    return
+                stats_var.set(translate("sync_checking").format(source))
+                try:
+                    entries = fetch_new_entries(source)
+                except Exception as e:
+                    failures.append(f"{source}: {remove_ansi_escape_sequences(str(e))}")
+                    continue
+                for idx, entry in enumerate(entries, start=1):
+                    if not download_running:
+                        return
+                    name = entry.get("title") or entry["id"]
+                    stats_var.set(
+                        translate("sync_downloading").format(idx, len(entries), name)
+                    )
+                    # A failed video is skipped and left out of the archive
+                    try:
+                        download_sync_entry(
+                            source, entry, download_type, output_format, destinations
+                        )
+                        downloaded += 1
+                    except Exception as e:
+                        error = remove_ansi_escape_sequences(str(e))
+                        failures.append(f"{name}: {error}")
+            update_progress(100)
+            stats_var.set(translate("sync_complete").format(downloaded))
+            send_notification(
+                translate("download_complete"),
+                translate("sync_complete").format(downloaded),
+            )
+            if failures:
+                messagebox.showwarning(
+                    translate("error"),
+                    translate("sync_failed").format(len(failures))
+                    + "\n\n"
+                    + "\n".join(failures[:10]),
+                )
+            if downloaded:
+                show_open_location_button()
+        finally:
+            download_running = False
+            toggle_button_state()
+
+    download_running = True
+    sync_thread = threading.Thread(target=run_sync)
+    sync_thread.start()
+    toggle_button_state()
+    root.after(500, watch_sync_thread)
+
+
+# Function to re-enable Sync only once the sync thread has really exited
+def watch_sync_thread():
+    if sync_thread is not None and sync_thread.is_alive():
+        root.after(500, watch_sync_thread)
+    else:
+        toggle_button_state()
+
+
 # Function to convert downloaded file format
 def convert_format(input_file, output_format):
     output_file = os.path.splitext(input_file)[0] + "." + output_format
@@ -362,7 +806,11 @@ def convert_format(input_file, output_format):
 # Function to stop the download
 def stop_download():
     global download_running, download_thread
-    if download_running and download_thread is not None:
+    job_thread_alive = any(
+        thread is not None and thread.is_alive()
+        for thread in (download_thread, sync_thread)
+    )
+    if download_running and job_thread_alive:
         download_running = False
         stats_var.set(translate("download_status"))
         toggle_button_state()
@@ -380,16 +828,25 @@ def toggle_button_state():
         download_button.config(
             text=translate("download"), command=download, style="Accent.TButton"
         )
+    # A stopped sync keeps running until its current video is done
+    if download_running or (sync_thread is not None and sync_thread.is_alive()):
+        sync_button.config(state="disabled")
+    else:
+        sync_button.config(state="normal")
 
 
 # Function to paste the link from the clipboard
 def paste_link():
     url_var.set(root.clipboard_get())
+    # A pasted URL is complete, so there is nothing to debounce
+    if prefetch_after_id is not None:
+        root.after_cancel(prefetch_after_id)
+    start_prefetch()
 
 
 # Function to open the file location
 def open_download_location():
-    path = destination_var.get()
+    path = last_destination or destination_var.get()
     if os.path.isdir(path):
         os.startfile(path)
     else:
@@ -493,6 +950,7 @@ def update_ui_language():
     download_path_label.config(text=translate("download_path"))
     choose_path_button.config(text=translate("choose_path"))
     download_button.config(text=translate("download"))
+    sync_button.config(text=translate("sync"))
     clear_history_button.config(text=translate("clear_history"))
     export_history_button.config(text=translate("export_history"))
     video_audio_label.config(text=translate("video_audio"))
@@ -532,6 +990,7 @@ info_var = tk.StringVar()
 stats_var = tk.StringVar()
 format_var = tk.StringVar(value="mp4")
 video_audio_var = tk.StringVar(value="video")
+url_var.trace_add("write", on_url_change)
 
 # URL field
 youtube_link_label = Label(
@@ -620,7 +1079,13 @@ def update_format_options():
 download_button = Button(
     download_tab, text=translate("download"), command=download, style="Accent.TButton"
 )
-download_button.grid(row=7, column=0, columnspan=3, padx=5, pady=10, sticky="ew")
+download_button.grid(row=7, column=0, columnspan=2, padx=5, pady=10, sticky="ew")
+
+# Button to sync channels/playlists
+sync_button = Button(
+    download_tab, text=translate("sync"), command=sync, style="TButton"
+)
+sync_button.grid(row=7, column=2, padx=5, pady=10, sticky="ew")
 
 # Progress bar
 progress_var = tk.DoubleVar()
@@ -709,6 +1174,30 @@ language_menu.add_command(
 language_menu.add_command(label="Español", command=lambda: change_language("es"))
 menubar.add_cascade(label="Language", menu=language_menu)
 
+
+# Function to remove a channel/playlist from the sync sources
+def remove_sync_source(source):
+    if messagebox.askyesno(
+        translate("sync"), translate("remove_sync_source").format(source)
+    ):
+        config["sync_sources"].remove(source)
+        save_config(config)
+        update_sync_menu()
+
+
+# Function to list the sync sources in the menu
+def update_sync_menu():
+    sync_menu.delete(0, "end")
+    for source in config.get("sync_sources", []):
+        sync_menu.add_command(
+            label=source, command=lambda src=source: remove_sync_source(src)
+        )
+
+
+sync_menu = tk.Menu(menubar, tearoff=0)
+update_sync_menu()
+menubar.add_cascade(label="Sync Sources", menu=sync_menu)
+
 info_menu = tk.Menu(menubar, tearoff=0)
 info_menu.add_command(label="GitHub Repository", command=open_github)
 info_menu.add_command(label="Donate", command=open_donation)
@@ -716,6 +1205,17 @@ menubar.add_cascade(label="Info", menu=info_menu)
 
 root.config(menu=menubar)
 
+
+# Function to drop pending prefetches when the window is closed
+def on_close():
+    with prefetch_lock:
+        for job in prefetch_jobs.values():
+            job.cancel()
+    root.destroy()
+
+
+root.protocol("WM_DELETE_WINDOW", on_close)
+
 # Update the UI with the initial language
 update_ui_language()
 